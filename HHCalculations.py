@@ -6,6 +6,9 @@ import math
 import Working_RC_Calcs
 import ssha_tools
 import utils
+import records
+import labels
+import partial_flow
 import os
 #import hhcalcs
 
@@ -99,6 +102,61 @@ def minimumEquivalentCircularPipe(peakQ, slope):
 		q = manningsCapacity(diameter=D, slope=slope, shape="CIR")
 		if q > peakQ: return D
 
+# ====================
+# PARTIAL FLOW
+# ====================
+
+#depth and velocity at the actual peak flow are interpolated in the
+#normalized tables of partial_flow, in one batch per table
+
+#sewer attributes read and written when the peak runoff is set
+peakFlowAttrs = ['id', 'peak_runoff', 'shape', 'diameter', 'height', 'width',
+				'capacity', 'velocity', 'depth_ratio', 'flow_depth', 'actual_velocity']
+
+def setPartialFlow(sewers):
+	"""
+	set the flow depth ratio, flow depth (inches) and actual velocity of a
+	list of records.Sewer at their peak runoff. sewers are grouped by partial
+	flow table so each table is interpolated once, with an array of Q/Qfull.
+	results are left null when a sewer lacks the capacity/velocity results or
+	its shape is unsupported
+	"""
+	groups = {}
+	for sewer in sewers:
+		sewer.depth_ratio = sewer.flow_depth = sewer.actual_velocity = None
+		if not sewer.capacity or not sewer.velocity or sewer.peak_runoff is None:
+			continue
+		key = partial_flow.partialFlowKey(sewer.shape, sewer.height, sewer.width)
+		if key is not None:
+			groups.setdefault(key, []).append(sewer)
+
+	for key, group in groups.items():
+		qRatios = [sewer.peak_runoff / sewer.capacity for sewer in group]
+		d, vRatio = partial_flow.partialFlow(partial_flow.partialFlowTable(key), qRatios)
+
+		for sewer, d_i, vRatio_i in zip(group, d.tolist(), vRatio.tolist()):
+			rise = sewer.diameter if key == "CIR" else sewer.height
+			sewer.depth_ratio = round(d_i, 3)
+			sewer.actual_velocity = round(vRatio_i * sewer.velocity, 2)
+			if rise: sewer.flow_depth = round(d_i * rise, 2)
+
+def writePeakRunoff(study_sewers, where, peakQ):
+	"""
+	write the peak runoff to the study sewers matching the where clause, along
+	with the flow depth and velocity at that peak runoff. the sewers are read
+	first so the partial flow lookup runs as one batch, then written back
+	"""
+	with arcpy.da.UpdateCursor(study_sewers, records.Sewer.field_names(peakFlowAttrs),
+								where_clause=where) as cursor:
+		sewers = dict((row[0], records.Sewer(row, peakFlowAttrs)) for row in cursor)
+		for sewer in sewers.values():
+			sewer.peak_runoff = peakQ
+		setPartialFlow(sewers.values())
+
+		cursor.reset()
+		for row in cursor:
+			cursor.updateRow(sewers[row[0]].to_row(peakFlowAttrs))
+
 
 def determineSymbologyTag(missingData, isTC, isSS, calculatedSlope, minSlopeAssumed):
 
@@ -119,6 +177,22 @@ def determineSymbologyTag(missingData, isTC, isSS, calculatedSlope, minSlopeAssu
 
 	return flag
 
+# ====================
+# LABEL TEXT
+# ====================
+
+#fields holding precomputed label text, so map labels are a plain field lookup
+#rather than a FindLabel expression evaluated on every redraw
+da_label_field = records.StudyArea.field('da_label')
+ss_label_field = records.Sewer.field('ss_label')
+label_field_length = 255
+
+def addSewerResultFields(study_sewers):
+	#add the label and partial flow result fields written by the calcs
+	utils.add_field_if_missing(study_sewers, ss_label_field, "TEXT", label_field_length)
+	for attr in ['depth_ratio', 'flow_depth', 'actual_velocity']:
+		utils.add_field_if_missing(study_sewers, records.Sewer.field(attr), "DOUBLE")
+
 def checkPipeYN (pipeValue):
 	#return boolean based on TC and Study Sewer flag
 	if (pipeValue == "Y"): return True
@@ -137,65 +211,40 @@ def applyDefaultFlags(study_pipes_cursor):
 
 	del study_pipes_cursor
 
+#limiting sewer attributes used by run_hydrology
+limitingSewerAttrs = ['id', 'capacity', 'sticker_link', 'install_year',
+					'slope_used', 'label', 'shed', 'label_tag']
+
 def minimumCapacityStudySewer(sewers_layer, study_area_id):
 
 	"""
-	Return the minimum study sewer capacity in a given study area.
+	Return the minimum capacity study sewer (a records.Sewer) in a given study
+	area, tagging it as the LimitingSewer.
 
-	this fails when processing a studyarea_id with none of the sewers tagged
+	returns None when processing a studyarea_id with none of the sewers tagged
 	with StudySewer = "Y"
 	"""
-	#search cursor on study sewers in ascending order on capacity
+	#update cursor on study sewers in ascending order on capacity
 	where = "StudyArea_ID = '{}' AND StudySewer = 'Y'".format(study_area_id)
 	sort = (None, 'ORDER BY Capacity ASC')
-	# fs ="Capacity; OBJECTID; STICKERLINK; Year_Installed; PIPESHAPE; Diameter; Height; Width;Slope_Used;LABEL;Label_Tag;SHEDNAME"
-	fields = ['Capacity', 'OBJECTID', 'STICKERLINK', 'Year_Installed',
-			'PIPESHAPE', 'Diameter', 'Height', 'Width','Slope_Used',
-			'LABEL','SHEDNAME','Label_Tag']
-
-	#sewers_layer = r'C:\Data\Code\HydraulicStudiesDevEnv\Small_Sewer_Capacity.gdb\StudiedWasteWaterGravMains'
 	arcpy.AddMessage('where = {}'.format(where))
 
-	with arcpy.da.UpdateCursor(sewers_layer, fields,
+	with arcpy.da.UpdateCursor(sewers_layer, records.Sewer.field_names(limitingSewerAttrs),
 								where, sql_clause = sort) as sewer_cursor:
 
-		#arcpy.AddMessage('sewer_cursor len	: {}'.format( len([row for row in sewer_cursor]) ))
-
 		#return first value, being the minimum capacity
-		for s in sewer_cursor:
-			arcpy.AddMessage('min pipe searching {}'.format(s[1]))
-			#grab values
-			capacity 		= s[0] #pipe.getValue("Capacity")
-			id 				= s[1] #pipe.getValue("OBJECTID")
-			sticker_link 	= s[2] #pipe.getValue("STICKERLINK")
-			intall_year 	= s[3] #pipe.getValue("Year_Installed")
-			Shape 			= s[4] #pipe.getValue("PIPESHAPE")
-			D 				= s[5] #pipe.getValue("Diameter")
-			H 				= s[6] #pipe.getValue("Height")
-			W 				= s[7] #pipe.getValue("Width")
-			slope			= s[8] #pipe.getValue("Slope_Used")
-			label			= s[9] #pipe.getValue("LABEL")
-			shed			= s[10] #pipe.getValue("SHEDNAME")
+		for row in sewer_cursor:
+			sewer = records.Sewer(row, limitingSewerAttrs)
+			arcpy.AddMessage('min pipe searching {}'.format(sewer.id))
 
 			#assign tag for labeling purposes
-			s[11] = 'LimitingSewer' #pipe.setValue("Label_Tag", "LimitingSewer")
-			sewer_cursor.updateRow(s)
+			sewer.label_tag = 'LimitingSewer'
+			sewer_cursor.updateRow(sewer.to_row(limitingSewerAttrs))
+			return sewer
 
-			break #move on after first iteration
-
-		try:
-			# if the no StudySewer tags are "Y", the query returns nothing, and
-			# these variables are not assigned
-			return {'capacity':capacity,
-					'id':id, 'sticker_link':sticker_link,
-					'intall_year':intall_year,
-					'D':D, 'H':H, 'W':W,
-					'Shape':Shape, 'Slope':slope,
-					'Label':label, 'Shed':shed}
-
-		except:
-			arcpy.AddWarning("Minimum capacity sewer not found in {}".format(study_area_id))
-			arcpy.AddWarning("Did you tag the StudySewers in that Study Area?")
+	# if the no StudySewer tags are "Y", the query returns nothing
+	arcpy.AddWarning("Minimum capacity sewer not found in {}".format(study_area_id))
+	arcpy.AddWarning("Did you tag the StudySewers in that Study Area?")
 
 
 # ====================
@@ -203,18 +252,14 @@ def minimumCapacityStudySewer(sewers_layer, study_area_id):
 # ====================
 
 def timeOfConcentration(studypipes, study_area_id):
-	#Return the time of concentration in a given study area
-	#search cursor on study sewers in ascending order on capacity
+	#Return the time of concentration in a given study area, summing the
+	#travel times along the TC path
 	where = "StudyArea_ID = '" + study_area_id + "' AND TC_Path = 'Y'"
-	pipesCursor = arcpy.SearchCursor(studypipes, where_clause = where, fields="TravelTime_min; OBJECTID")
-
 
 	tc = 3.0000 #set the initial tc to 3 minutes
-	for pipe in pipesCursor:
-		#print(pipe.getValue("TravelTime_min"))
-		tc += float(pipe.getValue("TravelTime_min") or 0) #the 'float or 0' handles null values
+	for pipe in records.Sewer.search(studypipes, where, attrs=['travel_time']):
+		tc += float(pipe.travel_time or 0) #the 'float or 0' handles null values
 
-	del pipesCursor
 	return round(tc, 2)
 
 
@@ -236,62 +281,71 @@ def run_hydrology(project_id, study_sewers, study_areas, study_area_id=None):
 
 	where = utils.where_clause_from_user_input(project_id, study_area_id)
 	arcpy.AddMessage("where hydrol = {}\nenv = {}".format(where, arcpy.env.workspace))
-	drainage_areas_cursor = arcpy.UpdateCursor(study_areas, where_clause = where)
-
-	for drainage_area in drainage_areas_cursor:
-
-		#work with each study area and determine the pipe calcs based on study area id
-		study_area_id = drainage_area.getValue("StudyArea_ID")
-		project_id = drainage_area.getValue("Project_ID")
-
-		#CALCULATIONS ON TC PATH PIPES
-		tc = timeOfConcentration(study_sewers, study_area_id)
-
-		#find limiting pipe in study area
-		arcpy.AddMessage("minimumCapacityStudySewer({},{})".format(study_sewers, study_area_id))
-		limitingSewer = minimumCapacityStudySewer(study_sewers, study_area_id)
-		# capacity = limitingSewer['capacity']
-		arcpy.AddMessage("min slope={}, id={}".format(limitingSewer['Slope'], id))
-
-		#RUNOFF CALCULATIONS
-		C = drainage_area.getValue("Runoff_Coefficient")
-		#C = Working_RC_Calcs.getC(study_area_id, project_id)
-		print C
-		A = drainage_area.getValue("SHAPE_Area") / 43560
-		I = 116 / ( tc + 17)
-		peak_runoff =  C * I * A
-
-		#update the peakflow in the study sewer
-		where = "Project_ID = {} AND StudyArea_ID = '{}' AND StudySewer = 'Y'".format(project_id, study_area_id)
-		with arcpy.da.UpdateCursor(study_sewers, ['Peak_Runoff'], where_clause=where) as cursor:
-			for sewer in cursor:
-				sewer[0] = peak_runoff
-				cursor.updateRow(sewer)
-
-		#replacement pipe characteristics
-		#replacementCapacity = max(peak_runoff, limitingPipe['capacity']) #capacity provided in new pipe should match existing Q or runoff Q (never decrease capacity)
-		replacementCapacity = peak_runoff #replacement pipe capacity can be decreased from existing
-		replacementD = max( minimumEquivalentCircularPipe(replacementCapacity, limitingSewer['Slope']), 18) #pipe diameter (inches) needed to pass the required Q, with a minimum D if 18 inches
-		minimumGrade = minSlopeRequired (shape="CIR", diameter=replacementD, height=None, width=None, peakQ=replacementCapacity)
-		#minimumGrade = minSlopeRequired(limitingPipe['Shape'], limitingPipe['D'], limitingPipe['H'], limitingPipe['W'], replacementCapacity)
-
-		#set row values and update row
-		drainage_area.setValue("Runoff_Coefficient", C)
-		drainage_area.setValue("Capacity", limitingSewer['capacity'])
-		drainage_area.setValue("TimeOfConcentration", tc)
-		drainage_area.setValue("StickerLink", limitingSewer['sticker_link'])
-		drainage_area.setValue("InstallDate", limitingSewer['intall_year'])
-		drainage_area.setValue("Intsensity", round(I, 2)) #NOTE -> spelling error in field name
-		drainage_area.setValue("Peak_Runoff", round(peak_runoff, 2))
-		drainage_area.setValue("Size", limitingSewer['Label']) #show existing size
-		drainage_area.setValue("ReplacementSize", str(replacementD))
-		drainage_area.setValue("MinimumGrade", round(minimumGrade, 4))
-		drainage_area.setValue("StudyShed", limitingSewer['Shed'])
-		drainage_areas_cursor.updateRow(drainage_area)
-
-	del drainage_areas_cursor,
-
-
+	utils.add_field_if_missing(study_areas, da_label_field, "TEXT", label_field_length)
+	addSewerResultFields(study_sewers)
+	with arcpy.da.UpdateCursor(study_areas, records.StudyArea.field_names(), where) as drainage_areas_cursor:
+
+		for row in drainage_areas_cursor:
+			drainage_area = records.StudyArea(row)
+
+			#work with each study area and determine the pipe calcs based on study area id
+			study_area_id = drainage_area.study_area_id
+			project_id = drainage_area.project_id
+
+			#CALCULATIONS ON TC PATH PIPES
+			tc = timeOfConcentration(study_sewers, study_area_id)
+
+			#find limiting pipe in study area
+			arcpy.AddMessage("minimumCapacityStudySewer({},{})".format(study_sewers, study_area_id))
+			limitingSewer = minimumCapacityStudySewer(study_sewers, study_area_id)
+			if limitingSewer is None:
+				arcpy.AddWarning("Skipping hydrology for {}".format(study_area_id))
+				continue
+			arcpy.AddMessage("min slope={}, id={}".format(limitingSewer.slope_used, limitingSewer.id))
+
+			#RUNOFF CALCULATIONS
+			C = drainage_area.runoff_coefficient
+			#C = Working_RC_Calcs.getC(study_area_id, project_id)
+			print C
+			A = drainage_area.area / 43560
+			I = 116 / ( tc + 17)
+			peak_runoff =  C * I * A
+
+			#update the peakflow in the study sewer
+			where = "Project_ID = {} AND StudyArea_ID = '{}' AND StudySewer = 'Y'".format(project_id, study_area_id)
+			#along with the flow depth and velocity at that peak flow
+			writePeakRunoff(study_sewers, where, peak_runoff)
+
+			#replacement pipe characteristics
+			#replacementCapacity = max(peak_runoff, limitingPipe['capacity']) #capacity provided in new pipe should match existing Q or runoff Q (never decrease capacity)
+			replacementCapacity = peak_runoff #replacement pipe capacity can be decreased from existing
+			replacementD = max( minimumEquivalentCircularPipe(replacementCapacity, limitingSewer.slope_used), 18) #pipe diameter (inches) needed to pass the required Q, with a minimum D if 18 inches
+			minimumGrade = minSlopeRequired (shape="CIR", diameter=replacementD, height=None, width=None, peakQ=replacementCapacity)
+			#minimumGrade = minSlopeRequired(limitingPipe['Shape'], limitingPipe['D'], limitingPipe['H'], limitingPipe['W'], replacementCapacity)
+
+			#set record values and update row
+			drainage_area.runoff_coefficient = C
+			drainage_area.capacity = limitingSewer.capacity
+			drainage_area.tc = tc
+			drainage_area.sticker_link = limitingSewer.sticker_link
+			drainage_area.install_date = limitingSewer.install_year
+			drainage_area.intensity = round(I, 2)
+			drainage_area.peak_runoff = round(peak_runoff, 2)
+			drainage_area.size = limitingSewer.label #show existing size
+			drainage_area.replacement_size = str(replacementD)
+			drainage_area.minimum_grade = round(minimumGrade, 4)
+			drainage_area.study_shed = limitingSewer.shed
+			drainage_area.da_label = labels.studyAreaLabel(drainage_area.area, C,
+								drainage_area.peak_runoff, drainage_area.capacity,
+								drainage_area.replacement_size, drainage_area.minimum_grade)
+			drainage_areas_cursor.updateRow(drainage_area.to_row())
+
+
+
+#sewer attributes read and written by run_hydraulics
+hydraulicsAttrs = ['id', 'length', 'shape', 'diameter', 'height', 'width', 'slope',
+				'slope_used', 'upstream_el', 'downstream_el', 'tc_path', 'study_sewer',
+				'tag', 'label', 'ss_label', 'velocity', 'capacity', 'travel_time', 'notes']
 
 #iterate through pipes and run calcs
 #def runCalcs (study_pipes_cursor):
@@ -299,91 +353,89 @@ def run_hydraulics(project_id, study_sewers, study_area_id=None):
 
 	where = utils.where_clause_from_user_input(project_id, study_area_id)
 	arcpy.AddMessage("where = {}".format(where))
-	study_sewers_cursor = arcpy.UpdateCursor(study_sewers, where_clause = where)
-
-	for sewer in study_sewers_cursor:
-
-		#Grab pipe parameters
-		S 		= sewer.getValue("Slope_Used") #slope used in calculations
-		S_orig	= sewer.getValue("Slope") #original slope from DataConv data
-		L 		= sewer.shape.length #access geometry directly to avoid bug where DA perimeter is read after join
-		D 		= sewer.getValue("Diameter")
-		H 		= sewer.getValue("Height")
-		W 		= sewer.getValue("Width")
-		Shape 	= sewer.getValue("PIPESHAPE")
-		U_el	= sewer.getValue("UpStreamElevation")
-		D_el	= sewer.getValue("DownStreamElevation")
-		id 		= sewer.getValue("OBJECTID")
-		TC		= sewer.getValue("TC_Path")
-		ss		= sewer.getValue("StudySewer")
-		tag 	= sewer.getValue("Tag")
-
-		#boolean flags for symbology
-		missingData = False #boolean representing whether the pipe is missing important data
-		isTC = checkPipeYN(TC) #False
-		isSS = checkPipeYN(ss) #False
-		calculatedSlope = False
-		minSlopeAssumed = False
-
-		#check if slope is Null, try to compute a slope or asssume a minimum value
-		arcpy.AddMessage("checking  sewer "  + str(id))
-		if S_orig is None:
-			if (U_el is not None) and (D_el is not None):
-				S = ( (U_el - D_el) / L ) * 100.0 #percent
-				sewer.setValue("Hyd_Study_Notes", "Autocalculated Slope")
-				calculatedSlope = True
-				arcpy.AddMessage("calculated slope = " + str(S) + ", ID = " + str(id))
-			elif S is not None and S != default_min_slope:
-			 	arcpy.AddMessage("Manual slope input on {}".format(id))
-			 	sewer.setValue("Hyd_Study_Notes", 'Manual slope input')
-				print 'type of thing {}'.format(type(S))
-			 	S = float(S)
-			else:
-				S = default_min_slope
-				sewer.setValue("Hyd_Study_Notes", "Minimum " + str(S) +  " slope assumed")
-				minSlopeAssumed = True
-				arcpy.AddMessage("\t min slope assumed = " + str(S)  + ", ID = " + str(id))
-
-		else: S = S_orig #use DataConv slope if provided
+	addSewerResultFields(study_sewers)
+	with arcpy.da.UpdateCursor(study_sewers, records.Sewer.field_names(hydraulicsAttrs), where) as study_sewers_cursor:
+
+		for row in study_sewers_cursor:
+			sewer = records.Sewer(row, hydraulicsAttrs)
+
+			#Grab pipe parameters
+			S 		= sewer.slope_used #slope used in calculations
+			S_orig	= sewer.slope #original slope from DataConv data
+			L 		= sewer.length #geometry length, avoids bug where DA perimeter is read after join
+			D 		= sewer.diameter
+			H 		= sewer.height
+			W 		= sewer.width
+			Shape 	= sewer.shape
+			U_el	= sewer.upstream_el
+			D_el	= sewer.downstream_el
+			id 		= sewer.id
+
+			#boolean flags for symbology
+			missingData = False #boolean representing whether the pipe is missing important data
+			isTC = checkPipeYN(sewer.tc_path) #False
+			isSS = checkPipeYN(sewer.study_sewer) #False
+			calculatedSlope = False
+			minSlopeAssumed = False
+
+			#check if slope is Null, try to compute a slope or asssume a minimum value
+			arcpy.AddMessage("checking  sewer "  + str(id))
+			if S_orig is None:
+				if (U_el is not None) and (D_el is not None):
+					S = ( (U_el - D_el) / L ) * 100.0 #percent
+					sewer.notes = "Autocalculated Slope"
+					calculatedSlope = True
+					arcpy.AddMessage("calculated slope = " + str(S) + ", ID = " + str(id))
+				elif S is not None and S != default_min_slope:
+					arcpy.AddMessage("Manual slope input on {}".format(id))
+					sewer.notes = 'Manual slope input'
+					print 'type of thing {}'.format(type(S))
+					S = float(S)
+				else:
+					S = default_min_slope
+					sewer.notes = "Minimum " + str(S) +  " slope assumed"
+					minSlopeAssumed = True
+					arcpy.AddMessage("\t min slope assumed = " + str(S)  + ", ID = " + str(id))
 
-		sewer.setValue("Slope_Used", round(float(S), 2))
+			else: S = S_orig #use DataConv slope if provided
 
+			sewer.slope_used = round(float(S), 2)
+			sewer.ss_label = labels.studySewerLabel(isSS, sewer.label, sewer.slope_used)
 
 
-		# check if any required data points are null, and skip accordingly
-		#logic -> if (diameter or height exists) and (if Shape is not UNK), then enough data for calcs
-		if ((D != None) or (H != None)) and (Shape != "UNK" or Shape != None):
 
-			try:
-				#compute pipe velocity
-				V = (1.49/ getMannings(Shape, D)) * math.pow(hydraulicRadius(Shape, D, H, W), 0.667) * math.pow(float(S)/100.0, 0.5)
-				sewer.setValue("Velocity", round(float(V), 2))
+			# check if any required data points are null, and skip accordingly
+			#logic -> if (diameter or height exists) and (if Shape is not UNK), then enough data for calcs
+			if ((D != None) or (H != None)) and (Shape != "UNK" or Shape != None):
 
-				#compute the capacity
-				Qmax = xarea(Shape, D, H, W) * V
-				sewer.setValue("Capacity", round(float(Qmax), 2))
+				try:
+					#compute pipe velocity
+					V = (1.49/ getMannings(Shape, D)) * math.pow(hydraulicRadius(Shape, D, H, W), 0.667) * math.pow(float(S)/100.0, 0.5)
+					sewer.velocity = round(float(V), 2)
 
-				#compute travel time in the pipe segment, be conservative if a min slope was used
-				if (minSlopeAssumed):
-					v_conservative = (1.49/ getMannings(Shape, D)) * math.pow(hydraulicRadius(Shape, D, H, W), 0.667) * math.pow(default_TC_slope/100, 0.5)
-					T = (L / v_conservative) / 60 # minutes
-				else:
-					T = (L / V) / 60 # minutes
+					#compute the capacity
+					Qmax = xarea(Shape, D, H, W) * V
+					sewer.capacity = round(float(Qmax), 2)
 
-				sewer.setValue("TravelTime_min", round(float(T), 3)) #arcpy.AddMessage("time = " + str(T))
+					#compute travel time in the pipe segment, be conservative if a min slope was used
+					if (minSlopeAssumed):
+						v_conservative = (1.49/ getMannings(Shape, D)) * math.pow(hydraulicRadius(Shape, D, H, W), 0.667) * math.pow(default_TC_slope/100, 0.5)
+						T = (L / v_conservative) / 60 # minutes
+					else:
+						T = (L / V) / 60 # minutes
 
-			except TypeError:
-				arcpy.AddWarning("Type error on pipe " + str(sewer.getValue("OBJECTID")))
+					sewer.travel_time = round(float(T), 3) #arcpy.AddMessage("time = " + str(T))
 
-		else:
-			missingData = True #not enough data for calcs
-			arcpy.AddMessage("skipped pipe " + str(sewer.getValue("OBJECTID")))
+				except TypeError:
+					arcpy.AddWarning("Type error on pipe " + str(id))
 
+			else:
+				missingData = True #not enough data for calcs
+				arcpy.AddMessage("skipped pipe " + str(id))
 
-		#apply symbology tag
-		theflag = determineSymbologyTag(missingData, isTC, isSS, calculatedSlope, minSlopeAssumed)
-		sewer.setValue("Tag", str(theflag))
 
-		study_sewers_cursor.updateRow(sewer)
+			#apply symbology tag
+			theflag = determineSymbologyTag(missingData, isTC, isSS, calculatedSlope, minSlopeAssumed)
+			sewer.tag = str(theflag)
 
-	del study_sewers_cursor
+			study_sewers_cursor.updateRow(sewer.to_row(hydraulicsAttrs))
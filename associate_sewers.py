@@ -72,6 +72,14 @@ def associate_sewers_to_area(project_id, from_sewers, study_sewers, study_areas)
 							target = study_sewers,
 							schema_type = "NO_TEST",)
 
+	#check that no main in the project was appended under more than one
+	#study area (e.g. by a repeated run with new StudyArea_IDs)
+	duplicates = utils.find_duplicates(study_sewers, ['FACILITYID'],
+										where = "Project_ID = " + project_id)
+	if duplicates:
+		arcpy.AddWarning("{} sewers appended more than once in project {}, run "
+						"the Check Duplicates tool to tag them".format(len(duplicates), project_id))
+
 	#memory clean up
 	arcpy.Delete_management(sewers)
 	arcpy.Delete_management(sewers2)
@@ -0,0 +1,212 @@
+#Verify or create the attribute indexes that the H&H calcs rely on
+import arcpy
+import time
+import os
+import json
+import hashlib
+
+study_sewers = arcpy.GetParameterAsText(0)
+study_areas = arcpy.GetParameterAsText(1)
+create_missing = arcpy.GetParameter(2) #optional, otherwise only verify
+
+# ==============
+# INDEX MANIFEST
+# ==============
+
+#expected attribute indexes, as lists of fields. Nearly every query filters on
+#these (where_clause_from_user_input, timeOfConcentration,
+#minimumCapacityStudySewer, write_peak_flows_to_sewers) or sorts on Capacity.
+#composite indexes are only created where the workspace supports them
+#(enterprise geodatabases), file gdbs rely on the single field indexes
+index_manifest = {
+	'study_sewers': [
+		['Project_ID'],
+		['StudyArea_ID'],
+		['StudySewer'],
+		['TC_Path'],
+		['Capacity'],
+		['StudyArea_ID', 'StudySewer'],
+		['StudyArea_ID', 'TC_Path'],
+	],
+	'study_areas': [
+		['Project_ID'],
+		['StudyArea_ID'],
+	],
+}
+
+#query timings saved by the last run that created indexes (or the first run),
+#keyed on the study sewers catalog path. later runs compare against these
+benchmark_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index_benchmark.json')
+regression_factor = 2.0 #warn when a query is this many times slower than saved
+regression_min_seconds = 0.01 #ignore differences below timer noise
+
+max_index_name_length = 30 #oracle limit, names must be unique across the schema
+
+def index_name(table, fields):
+	"""
+	return an index name made of the table and field names, so the same
+	fields indexed on different tables get different names. names longer
+	than max_index_name_length are truncated and end in a short hash of the
+	full name to keep them unique
+	"""
+	table_name = os.path.basename(arcpy.Describe(table).catalogPath).split('.')[-1]
+	name = "IDX_" + table_name[:10] + "_" + "_".join(fields)
+	if len(name) > max_index_name_length:
+		digest = hashlib.md5(name.encode('utf-8')).hexdigest()[:6]
+		name = name[:max_index_name_length - 7] + "_" + digest
+	return name
+
+def supports_composite_indexes(table):
+	"""
+	return True if the workspace holding the table supports multi field
+	attribute indexes (enterprise geodatabases)
+	"""
+	path = arcpy.Describe(table).catalogPath
+	while os.path.dirname(path) != path and arcpy.Describe(path).dataType != 'Workspace':
+		path = os.path.dirname(path)
+	return arcpy.Describe(path).workspaceType == 'RemoteDatabase'
+
+def missing_indexes(table, expected):
+	"""
+	return the expected index field lists that have no matching attribute
+	index on the table (field order matters for composite indexes)
+	"""
+	existing = set()
+	for index in arcpy.ListIndexes(table):
+		existing.add(tuple(field.name.upper() for field in index.fields))
+
+	return [fields for fields in expected
+			if tuple(f.upper() for f in fields) not in existing]
+
+def time_query(table, where, sql_clause=(None, None), repeat=3):
+	"""
+	return the best time (seconds) of reading every row matching the where
+	clause, and the number of rows. one untimed read warms the cache first
+	"""
+	with arcpy.da.SearchCursor(table, ['OID@'], where, sql_clause=sql_clause) as cursor:
+		for row in cursor: pass
+
+	best = None
+	for i in range(repeat):
+		start = time.time()
+		with arcpy.da.SearchCursor(table, ['OID@'], where, sql_clause=sql_clause) as cursor:
+			n = sum(1 for row in cursor)
+		elapsed = time.time() - start
+		best = elapsed if best is None else min(best, elapsed)
+	return best, n
+
+def sample_study_area(study_areas):
+	#return a (project_id, study_area_id) to run the benchmark queries on
+	with arcpy.da.SearchCursor(study_areas, ['Project_ID', 'StudyArea_ID'],
+								"StudyArea_ID IS NOT NULL") as cursor:
+		for project_id, study_area_id in cursor:
+			return project_id, study_area_id
+	return 0, '' #empty table, queries return no rows
+
+def benchmark_queries(study_sewers, study_areas, project_id, study_area_id):
+	"""
+	time the representative calc queries against a sample study area and
+	return a dict of {description: seconds}
+	"""
+	queries = [
+		('sewers in project', study_sewers,
+			"Project_ID = {}".format(project_id), (None, None)),
+		('tc path', study_sewers,
+			"StudyArea_ID = '{}' AND TC_Path = 'Y'".format(study_area_id), (None, None)),
+		('limiting sewer', study_sewers,
+			"StudyArea_ID = '{}' AND StudySewer = 'Y'".format(study_area_id),
+			(None, 'ORDER BY Capacity ASC')),
+		('peak flow sewers', study_sewers,
+			"Project_ID = {} AND StudyArea_ID = '{}' AND StudySewer = 'Y'".format(project_id, study_area_id),
+			(None, None)),
+		('areas in project', study_areas,
+			"Project_ID = {}".format(project_id), (None, None)),
+	]
+
+	results = {}
+	for description, table, where, sql_clause in queries:
+		seconds, n = time_query(table, where, sql_clause)
+		arcpy.AddMessage("\t{}: {:.4f} s ({} rows)".format(description, seconds, n))
+		results[description] = seconds
+	return results
+
+def load_benchmarks():
+	if not os.path.exists(benchmark_file):
+		return {}
+	with open(benchmark_file) as f:
+		return json.load(f)
+
+def save_benchmark(table, project_id, study_area_id, timings):
+	benchmarks = load_benchmarks()
+	benchmarks[table] = {'project_id':project_id, 'study_area_id':study_area_id,
+						'timings':timings}
+	with open(benchmark_file, 'w') as f:
+		json.dump(benchmarks, f, indent=2, sort_keys=True)
+	arcpy.AddMessage("saved query timings to {}".format(benchmark_file))
+
+def check_regressions(saved, timings):
+	#warn about queries that became much slower than the saved timings
+	for description, seconds in sorted(timings.items()):
+		baseline = saved.get(description)
+		if baseline is None: continue
+		if seconds > baseline * regression_factor and seconds - baseline > regression_min_seconds:
+			arcpy.AddWarning("{} query slower than saved: {:.4f} s -> {:.4f} s".format(
+							description, baseline, seconds))
+
+def provision_indexes(study_sewers, study_areas, create_missing=False):
+
+	"""
+	check the study sewers and study areas against the index manifest, and
+	optionally create any missing indexes. the representative queries are
+	benchmarked before and after, and compared against the timings saved by
+	an earlier run so regressions (e.g. after a schema change) are reported
+	"""
+
+	tables = {'study_sewers':study_sewers, 'study_areas':study_areas}
+
+	#reuse the saved sample study area so timings are comparable
+	catalog_path = arcpy.Describe(study_sewers).catalogPath
+	saved = load_benchmarks().get(catalog_path)
+	if saved:
+		project_id, study_area_id = saved['project_id'], saved['study_area_id']
+	else:
+		project_id, study_area_id = sample_study_area(study_areas)
+
+	arcpy.AddMessage("benchmark before:")
+	before = benchmark_queries(study_sewers, study_areas, project_id, study_area_id)
+	if saved:
+		check_regressions(saved['timings'], before)
+
+	missing_count = 0
+	for key, table in tables.items():
+		composite = supports_composite_indexes(table)
+		for fields in missing_indexes(table, index_manifest[key]):
+			if len(fields) > 1 and not composite:
+				continue #not supported by this backend
+
+			missing_count += 1
+			if create_missing:
+				name = index_name(table, fields)
+				arcpy.AddMessage("adding index {} to {}".format(name, table))
+				arcpy.AddIndex_management(table, fields, name)
+			else:
+				arcpy.AddWarning("missing index on {} ({})".format(table, ", ".join(fields)))
+
+	if create_missing and missing_count > 0:
+		arcpy.AddMessage("benchmark after:")
+		after = benchmark_queries(study_sewers, study_areas, project_id, study_area_id)
+		for description in sorted(before):
+			arcpy.AddMessage("\t{}: {:.4f} s -> {:.4f} s".format(description,
+							before[description], after[description]))
+		save_benchmark(catalog_path, project_id, study_area_id, after)
+
+	elif not saved:
+		save_benchmark(catalog_path, project_id, study_area_id, before)
+
+	return missing_count
+
+
+# ===========================
+# Run the tool
+# ===========================
+provision_indexes(study_sewers, study_areas, create_missing)
@@ -0,0 +1,53 @@
+#Compare the memory used to hold studied sewers as records.Sewer objects
+#against cursor row lists and field name dicts
+import arcpy
+import sys
+import records
+
+study_sewers = arcpy.GetParameterAsText(0)
+n = int(arcpy.GetParameterAsText(1) or 100000) #optional, number of sewers
+
+#sewer attributes in the original StudiedSewers schema, i.e. without the
+#result fields added by HHCalculations.addSewerResultFields
+result_attrs = ['ss_label', 'depth_ratio', 'flow_depth', 'actual_velocity']
+schema_attrs = [attr for attr, field in records.Sewer.schema if attr not in result_attrs]
+
+def container_bytes(objects):
+	#field values are shared between representations, so only the size of
+	#the containers themselves is compared
+	return sum(sys.getsizeof(obj) for obj in objects)
+
+def benchmark_sewer_memory(study_sewers, n=100000):
+
+	"""
+	read n sewers (repeating the table's rows as needed) and report the
+	memory per n sewers held as row lists, dicts and Sewer records
+	"""
+
+	fields = records.Sewer.field_names(schema_attrs)
+	with arcpy.da.SearchCursor(study_sewers, fields) as cursor:
+		rows = [list(row) for row in cursor]
+	if not rows:
+		arcpy.AddWarning("no sewers in {}".format(study_sewers))
+		return
+
+	rows = [list(rows[i % len(rows)]) for i in range(n)]
+	representations = [
+		('row lists', rows),
+		('dicts', [dict(zip(fields, row)) for row in rows]),
+		('Sewer records', [records.Sewer(row, schema_attrs) for row in rows]),
+	]
+
+	results = {}
+	for description, objects in representations:
+		results[description] = container_bytes(objects)
+		arcpy.AddMessage("{}: {:.1f} MB per {} sewers ({} bytes each)".format(
+						description, results[description] / 1048576.0, n,
+						results[description] // n))
+	return results
+
+
+# ===========================
+# Run the tool
+# ===========================
+benchmark_sewer_memory(study_sewers, n)
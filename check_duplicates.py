@@ -0,0 +1,41 @@
+#Find duplicate rows in a table, e.g. parcels by PARCELID or StudiedSewers
+#appended more than once by associate_sewers (FACILITYID)
+import arcpy
+import utils
+
+table = arcpy.GetParameterAsText(0)
+key_fields = arcpy.GetParameterAsText(1) #optional if checking geometry, semicolon delimited, e.g. PARCELID or FACILITYID
+check_geometry = arcpy.GetParameter(2) #optional, also require identical shapes
+tag_field = arcpy.GetParameterAsText(3) #optional, tagged 1 for duplicates, otherwise 0
+
+def check_duplicates(table, key_fields, check_geometry=False, tag_field=None):
+
+	"""
+	report (and optionally tag) duplicate rows in the table based on the key
+	fields and, optionally, the geometry
+	"""
+
+	keys = [field for field in key_fields.split(";") if field]
+	if not keys and not check_geometry:
+		arcpy.AddError("Provide key fields, check geometry, or both")
+		return
+
+	if tag_field:
+		utils.add_field_if_missing(table, tag_field, "SHORT")
+
+	duplicates = utils.find_duplicates(table, keys,
+										geometry=check_geometry,
+										tag_field=tag_field or None)
+	if duplicates:
+		#list the first few, the full set can be selected via the tag field
+		oids = sorted(duplicates)
+		arcpy.AddWarning("duplicate OBJECTIDs: {}{}".format(
+						", ".join(str(oid) for oid in oids[:50]),
+						" ..." if len(oids) > 50 else ""))
+	return duplicates
+
+
+# ===========================
+# Run the tool
+# ===========================
+check_duplicates(table, key_fields, check_geometry, tag_field)
@@ -0,0 +1,40 @@
+import decimal
+
+"""
+label text for the drainage areas and studied sewers, formatted the same as
+the FindLabel expressions in arcmap_expresssions so the map labels can read a
+stored field instead. Kept free of arcpy so it can be tested on its own
+"""
+
+def labelNumber(value, digits):
+	"""
+	format a number as VBScript concatenates round(value, digits) into a
+	string: halves round to even (VBScript's Round is banker's rounding) and
+	trailing zeros are dropped. null values concatenate as blank
+	"""
+	if value is None: return ""
+	rounded = decimal.Decimal(repr(float(value))).quantize(
+				decimal.Decimal(1).scaleb(-digits), rounding=decimal.ROUND_HALF_EVEN)
+	text = "{:f}".format(rounded)
+	if "." in text: text = text.rstrip("0").rstrip(".")
+	if text == "-0": text = "0"
+	return text
+
+def studyAreaLabel(area, C, peakQ, capacity, replacementSize, minimumGrade):
+	#return the drainage area label text (area in sqft), matching the
+	#arcmap_expresssions/StudyAreaSummary2.lxp expression
+	lines = [
+		"Drainage Area = " + labelNumber(area / 43560.0, 2) + " ac",
+		"Runoff Coefficient = " + labelNumber(C, 2),
+		"Peak Runoff = " + labelNumber(peakQ, 1) + " CFS",
+		"Existing Capacity = " + labelNumber(capacity, 1) + " CFS",
+		"Replacement Size = " + (replacementSize or "") + '"',
+		"Minimum Grade = " + labelNumber(minimumGrade, 2) + "%",
+	]
+	return "".join(line + "\r\n" for line in lines) #vbNewLine
+
+def studySewerLabel(isSS, sizeLabel, slope):
+	#return the studied sewer label text, matching the
+	#arcmap_expresssions/studied_pipe_label.lxp expression (study sewers only)
+	if not isSS: return None
+	return (sizeLabel or "") + " @ " + labelNumber(slope, 2) + "% "
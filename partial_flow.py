@@ -0,0 +1,90 @@
+import numpy
+
+"""
+normalized partial flow tables of Q/Qfull and V/Vfull versus d/D (depth over
+rise) for the circular, egg and box sections, so depth and velocity at the
+actual peak flow are found by interpolation rather than solving mannings
+iteratively per pipe. Kept free of arcpy so it can be tested on its own
+"""
+
+partialFlowTableSize = 1001 #depth increments in each table
+partialFlowTables = {} #built on first use, keyed on shape (and box width/height)
+
+def halfWidthCircular(y):
+	#half width of a circular section at depth y, in units of the diameter
+	return numpy.sqrt(numpy.maximum(y * (1.0 - y), 0.0))
+
+def halfWidthEgg(y):
+	#half width of a standard egg section (rise = 1.5 x span) at depth y, in
+	#units of the rise. crown radius = span/2, side radius = 1.5 x span,
+	#invert radius = span/4, with the invert arc meeting the sides at 0.1 x span
+	D = 1.0 / 1.5
+	invert = numpy.sqrt(numpy.maximum((D/4.0)**2 - (y - D/4.0)**2, 0.0))
+	sides = numpy.sqrt(numpy.maximum((1.5*D)**2 - (y - D)**2, 0.0)) - D
+	crown = numpy.sqrt(numpy.maximum((D/2.0)**2 - (y - D)**2, 0.0))
+	return numpy.where(y < 0.1*D, invert, numpy.where(y <= D, sides, crown))
+
+def buildPartialFlowTable(halfWidth):
+	"""
+	return arrays of d/D, Q/Qfull and V/Vfull for a section described by its
+	half width function, integrating area and wetted perimeter numerically.
+	At d/D = 1 the section flows full and the ratios are 1. The d/D and
+	Q/Qfull arrays are also returned up to the free surface maximum Q/Qfull,
+	where Q/Qfull only increases with depth, for inverse lookups
+	"""
+	y = numpy.linspace(0.0, 1.0, partialFlowTableSize)
+	x = halfWidth(y)
+	dy = numpy.diff(y)
+
+	A = numpy.concatenate(([0.0], numpy.cumsum((x[1:] + x[:-1]) * dy)))
+	P = 2.0*x[0] + numpy.concatenate(([0.0], numpy.cumsum(2.0 * numpy.hypot(numpy.diff(x), dy))))
+	A_full = A[-1]
+	Rh_full = A_full / (P[-1] + 2.0*x[-1]) #closed top included when flowing full
+
+	Rh = A / numpy.where(P > 0, P, 1.0)
+	v_ratio = numpy.power(Rh / Rh_full, 0.667)
+	q_ratio = (A / A_full) * v_ratio
+	v_ratio[-1] = q_ratio[-1] = 1.0
+
+	peak = numpy.argmax(q_ratio)
+	return y, q_ratio, v_ratio, y[:peak + 1], q_ratio[:peak + 1]
+
+def partialFlowKey(shape, height=None, width=None):
+	#return the partial flow table key of a pipe shape, or None if the shape
+	#is unsupported. box tables depend on the width/height ratio
+	if (shape == "CIR" or shape == "CIRCULAR"):
+		return "CIR"
+	elif (shape == "EGG" or shape == "EGG SHAPE"):
+		return "EGG"
+	elif (shape == "BOX" or shape == "BOX SHAPE") and height and width:
+		return ("BOX", round(float(width) / height, 2))
+
+def partialFlowTable(key):
+	#return the (cached) normalized partial flow table for a table key
+	if key not in partialFlowTables:
+		if key == "CIR":
+			halfWidth = halfWidthCircular
+		elif key == "EGG":
+			halfWidth = halfWidthEgg
+		else:
+			halfWidth = lambda y: numpy.zeros_like(y) + key[1] / 2.0
+		partialFlowTables[key] = buildPartialFlowTable(halfWidth)
+	return partialFlowTables[key]
+
+def partialFlow(table, qRatio):
+	"""
+	return d/D and V/Vfull for flow ratio(s) Q/Qfull, interpolated in a
+	partial flow table. qRatio may be a scalar or a numpy array. Flows beyond
+	the free surface maximum (e.g. 1.076 Qfull for circular pipes) are
+	surcharged, returned as d/D = 1 and V/Vfull = Q/Qfull
+	"""
+	y, q, v, yRising, qRising = table
+	qRatio = numpy.asarray(qRatio, dtype=float)
+
+	d = numpy.interp(qRatio, qRising, yRising)
+	vRatio = numpy.interp(d, y, v)
+
+	surcharged = qRatio > qRising[-1]
+	d = numpy.where(surcharged, 1.0, d)
+	vRatio = numpy.where(surcharged, qRatio, vRatio)
+	return d, vRatio
@@ -0,0 +1,108 @@
+import arcpy
+
+"""
+compact record types for the studied sewers and study areas used in the
+calcs. The mapping of record attributes to geodatabase fields is defined here
+(and only here), in the field order used for cursors
+"""
+
+class Record(object):
+
+	"""
+	base record, built directly from a cursor row whose fields are given by
+	field_names(). Subclasses define the schema as (attribute, field) pairs.
+	Cursors can ask for a subset of attributes (in that order), in which case
+	the other slots are left unset
+	"""
+
+	__slots__ = ()
+	schema = ()
+
+	def __init__(self, row, attrs=None):
+		for attr, value in zip(attrs or self.__slots__, row):
+			setattr(self, attr, value)
+
+	@classmethod
+	def field_names(cls, attrs=None):
+		#return the geodatabase field names of all (or the given) attributes
+		if attrs is None:
+			return [field for attr, field in cls.schema]
+		fields = dict(cls.schema)
+		return [fields[attr] for attr in attrs]
+
+	@classmethod
+	def field(cls, attr):
+		#return the geodatabase field name of an attribute
+		return dict(cls.schema)[attr]
+
+	@classmethod
+	def search(cls, table, where=None, sql_clause=(None, None), attrs=None):
+		#yield a record for each row returned by a search cursor on the table
+		with arcpy.da.SearchCursor(table, cls.field_names(attrs), where,
+									sql_clause = sql_clause) as cursor:
+			for row in cursor:
+				yield cls(row, attrs)
+
+	def to_row(self, attrs=None):
+		#return the record as a row list, ready for cursor.updateRow(). attrs
+		#must match those the record was read with
+		return [getattr(self, attr) for attr in attrs or self.__slots__]
+
+
+class Sewer(Record):
+
+	schema = (
+		('id',				'OBJECTID'),
+		('project_id',		'Project_ID'),
+		('study_area_id',	'StudyArea_ID'),
+		('length',			'SHAPE@LENGTH'), #geometry length, avoids reading a joined perimeter
+		('shape',			'PIPESHAPE'),
+		('diameter',		'Diameter'),
+		('height',			'Height'),
+		('width',			'Width'),
+		('slope',			'Slope'), #original slope from DataConv data
+		('slope_used',		'Slope_Used'), #slope used in calculations
+		('upstream_el',		'UpStreamElevation'),
+		('downstream_el',	'DownStreamElevation'),
+		('tc_path',			'TC_Path'),
+		('study_sewer',		'StudySewer'),
+		('tag',				'Tag'),
+		('label',			'LABEL'),
+		('label_tag',		'Label_Tag'),
+		('ss_label',		'SS_Label'),
+		('sticker_link',	'STICKERLINK'),
+		('install_year',	'Year_Installed'),
+		('shed',			'SHEDNAME'),
+		('velocity',		'Velocity'),
+		('capacity',		'Capacity'),
+		('travel_time',		'TravelTime_min'),
+		('peak_runoff',		'Peak_Runoff'),
+		('depth_ratio',		'DepthRatio'), #d/D at peak runoff
+		('flow_depth',		'FlowDepth'), #inches
+		('actual_velocity',	'ActualVelocity'), #ft/s at peak runoff
+		('notes',			'Hyd_Study_Notes'),
+	)
+	__slots__ = tuple(attr for attr, field in schema)
+
+
+class StudyArea(Record):
+
+	schema = (
+		('id',					'OBJECTID'),
+		('project_id',			'Project_ID'),
+		('study_area_id',		'StudyArea_ID'),
+		('area',				'SHAPE@AREA'), #sqft
+		('runoff_coefficient',	'Runoff_Coefficient'),
+		('capacity',			'Capacity'),
+		('tc',					'TimeOfConcentration'),
+		('sticker_link',		'StickerLink'),
+		('install_date',		'InstallDate'),
+		('intensity',			'Intsensity'), #NOTE -> spelling error in field name
+		('peak_runoff',			'Peak_Runoff'),
+		('size',				'Size'),
+		('replacement_size',	'ReplacementSize'),
+		('minimum_grade',		'MinimumGrade'),
+		('study_shed',			'StudyShed'),
+		('da_label',			'DA_Label'),
+	)
+	__slots__ = tuple(attr for attr, field in schema)
@@ -7,8 +7,10 @@ import os
 
 def write_peak_flows_to_sewers(study_areas, study_sewers):
 	"""
-	write the peak runoff stored in the study areas layer to each studied sewer
+	write the peak runoff stored in the study areas layer to each studied sewer,
+	along with the flow depth and velocity at that peak runoff
 	"""
+	HHCalculations.addSewerResultFields(study_sewers)
 
 	fields = ['Project_ID', 'StudyArea_ID', 'Peak_Runoff']
 	with arcpy.da.SearchCursor(study_areas, fields) as areas_cursor:
@@ -19,13 +21,8 @@ def write_peak_flows_to_sewers(study_areas, study_sewers):
 			# arcpy.AddMessage('{} - {} peak runoff = {}'.format(project_id, study_area_id, peak_runoff))
 			print '{} - {} peak runoff = {}'.format(project_id, study_area_id, peak_runoff)
 			#update the peakflow in the study sewer
-			ss_fields = ['Peak_Runoff']
 			where = "Project_ID = {} AND StudyArea_ID = '{}' AND StudySewer = 'Y'".format(project_id, study_area_id)
-			with arcpy.da.UpdateCursor(study_sewers, ss_fields, where_clause=where) as cursor:
-				for sewer in cursor:
-					sewer[0] = peak_runoff
-
-					cursor.updateRow(sewer)
+			HHCalculations.writePeakRunoff(study_sewers, where, peak_runoff)
 
 
 def updateDAIndex (project_id, study_areas, study_area_indices):
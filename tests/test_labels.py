@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import labels
+
+
+class LabelNumberTest(unittest.TestCase):
+
+	#expected values are what VBScript's round(value, digits) & "" gives
+	def test_halves_round_to_even(self):
+		self.assertEqual(labels.labelNumber(2.25, 1), "2.2")
+		self.assertEqual(labels.labelNumber(2.75, 1), "2.8")
+		self.assertEqual(labels.labelNumber(0.125, 2), "0.12")
+		self.assertEqual(labels.labelNumber(0.375, 2), "0.38")
+		self.assertEqual(labels.labelNumber(2.5, 0), "2")
+		self.assertEqual(labels.labelNumber(3.5, 0), "4")
+
+	def test_trailing_zeros_dropped(self):
+		self.assertEqual(labels.labelNumber(2.0, 2), "2")
+		self.assertEqual(labels.labelNumber(0.5, 2), "0.5")
+		self.assertEqual(labels.labelNumber(12.3456, 2), "12.35")
+
+	def test_null_is_blank(self):
+		self.assertEqual(labels.labelNumber(None, 1), "")
+
+
+class LabelTextTest(unittest.TestCase):
+
+	def test_study_area_label(self):
+		text = labels.studyAreaLabel(87120.0, 0.85, 2.25, 3.0, "18", 0.4)
+		self.assertEqual(text, "Drainage Area = 2 ac\r\n"
+								"Runoff Coefficient = 0.85\r\n"
+								"Peak Runoff = 2.2 CFS\r\n"
+								"Existing Capacity = 3 CFS\r\n"
+								'Replacement Size = 18"\r\n'
+								"Minimum Grade = 0.4%\r\n")
+
+	def test_study_sewer_label(self):
+		self.assertEqual(labels.studySewerLabel(True, '12"', 0.5), '12" @ 0.5% ')
+		self.assertEqual(labels.studySewerLabel(False, '12"', 0.5), None)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import partial_flow
+
+
+def sectionProperties(halfWidth, n=100001):
+	#full area and hydraulic radius of a section, in units of its rise
+	y = numpy.linspace(0.0, 1.0, n)
+	x = halfWidth(y)
+	dy = numpy.diff(y)
+	A = numpy.sum((x[1:] + x[:-1]) * dy)
+	P = numpy.sum(2.0 * numpy.hypot(numpy.diff(x), dy)) + 2.0*x[0] + 2.0*x[-1]
+	return A, A / P
+
+
+class PartialFlowTableTest(unittest.TestCase):
+
+	def test_circular_free_surface_maximum(self):
+		y, q, v, yRising, qRising = partial_flow.partialFlowTable("CIR")
+		self.assertAlmostEqual(qRising[-1], 1.0758, places=3)
+		self.assertAlmostEqual(yRising[-1], 0.938, places=2)
+
+	def test_circular_depths(self):
+		table = partial_flow.partialFlowTable("CIR")
+		d, vRatio = partial_flow.partialFlow(table, [0.5, 1.0])
+		self.assertAlmostEqual(d[0], 0.5, places=2) #half full carries half of Qfull
+		self.assertAlmostEqual(vRatio[0], 1.0, places=2) #at full pipe velocity
+		self.assertAlmostEqual(d[1], 0.82, places=2)
+
+	def test_egg_matches_xarea_and_hydraulic_radius(self):
+		#xarea = 0.5105 H^2 and hydraulicRadius = 0.1931 H for egg sections
+		A, Rh = sectionProperties(partial_flow.halfWidthEgg)
+		self.assertAlmostEqual(A, 0.5105, places=3)
+		self.assertAlmostEqual(Rh, 0.1931, places=3)
+
+	def test_full_section_ratios_are_one(self):
+		for key in ["CIR", "EGG", ("BOX", 1.5)]:
+			y, q, v, yRising, qRising = partial_flow.partialFlowTable(key)
+			self.assertEqual((y[-1], q[-1], v[-1]), (1.0, 1.0, 1.0))
+
+	def test_keys(self):
+		self.assertEqual(partial_flow.partialFlowKey("CIRCULAR"), "CIR")
+		self.assertEqual(partial_flow.partialFlowKey("EGG SHAPE", 30, 20), "EGG")
+		self.assertEqual(partial_flow.partialFlowKey("BOX", 48.0, 72.0), ("BOX", 1.5))
+		self.assertEqual(partial_flow.partialFlowKey("BOX", 48.0, None), None)
+		self.assertEqual(partial_flow.partialFlowKey("UNK"), None)
+
+
+class SurchargeTest(unittest.TestCase):
+
+	def test_above_free_surface_maximum_is_surcharged(self):
+		for key in ["CIR", "EGG", ("BOX", 1.5)]:
+			table = partial_flow.partialFlowTable(key)
+			qMax = table[4][-1]
+			d, vRatio = partial_flow.partialFlow(table, [qMax * 1.01, 2.0])
+			self.assertEqual(list(d), [1.0, 1.0])
+			self.assertAlmostEqual(vRatio[0], qMax * 1.01)
+			self.assertAlmostEqual(vRatio[1], 2.0)
+
+
+if __name__ == '__main__':
+	unittest.main()
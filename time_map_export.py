@@ -0,0 +1,33 @@
+#Time the Data Driven Pages (map book) export of a map document. Used to
+#benchmark labeling changes, e.g. FindLabel expressions vs. the precomputed
+#DA_Label and SS_Label fields written by the H&H calcs
+import arcpy
+import time
+
+mxd_path = arcpy.GetParameterAsText(0) #optional, defaults to the open map
+out_pdf = arcpy.GetParameterAsText(1)
+
+def time_map_book_export(mxd_path, out_pdf):
+
+	"""
+	export all Data Driven Pages of the map document to a pdf and return the
+	elapsed time in seconds
+	"""
+
+	mxd = arcpy.mapping.MapDocument(mxd_path or "CURRENT")
+	ddp = mxd.dataDrivenPages
+
+	start = time.time()
+	ddp.exportToPDF(out_pdf, "ALL")
+	elapsed = time.time() - start
+
+	arcpy.AddMessage("exported {} pages in {:.1f} s ({:.2f} s/page)".format(
+					ddp.pageCount, elapsed, elapsed / max(ddp.pageCount, 1)))
+	del mxd
+	return elapsed
+
+
+# ===========================
+# Run the tool
+# ===========================
+time_map_book_export(mxd_path, out_pdf)
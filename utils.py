@@ -1,5 +1,6 @@
 import arcpy
 import random
+import hashlib
 
 """
 utilty/convenience functions. especially for working with arcpy
@@ -57,6 +58,17 @@ def match_schemas(matchToTable, editSchemaTable, delete_fields = True):
 			arcpy.AddField_management(in_table = editSchemaTable, field_name = field.name, field_type = field.type.upper(), field_length = field.length)
 
 
+def add_field_if_missing(table, field_name, field_type, field_length=None):
+
+	"""
+	add a field to the table, unless a field with that name already exists
+	"""
+	if not arcpy.ListFields(table, field_name):
+		arcpy.AddMessage("adding {} to {}".format(field_name, table))
+		arcpy.AddField_management(in_table = table, field_name = field_name,
+								field_type = field_type, field_length = field_length)
+
+
 def unique_values(table, field):
 
 	"""
@@ -68,6 +80,55 @@ def unique_values(table, field):
 		uniq_vals_sql_friendly = str(tuple(uniq_vals)).replace("u", "")
 		return uniq_vals_sql_friendly
 
+def find_duplicates(table, key_fields, geometry=False, tag_field=None, where=None):
+
+	"""
+	return the set of OBJECTIDs of rows whose key field values (e.g. PARCELID,
+	or FACILITYID within a project) repeat those of an earlier row. Keys are
+	checked against a hash set in a single pass of a cursor. If geometry is
+	True, an md5 digest of the shape's WKB is included in the key so only
+	geometrically identical rows are flagged. If a tag_field is given, each
+	row is tagged 1 (duplicate) or 0 during the same pass. key_fields may be
+	empty when geometry is True, to find geometric duplicates only. Rows with a null
+	key value (or null shape) are never duplicates, they are only counted.
+	"""
+	fields = ['OID@'] + list(key_fields)
+	if geometry: fields.append('SHAPE@WKB')
+	if tag_field: fields.append(tag_field)
+	n_keys = len(fields) - 1 - bool(tag_field)
+
+	seen = set()
+	duplicates = set()
+	null_keys = 0
+	if tag_field: cursor = arcpy.da.UpdateCursor(table, fields, where)
+	else: cursor = arcpy.da.SearchCursor(table, fields, where)
+
+	with cursor:
+		for row in cursor:
+			key = tuple(row[1:1 + n_keys])
+			if geometry:
+				wkb = key[-1]
+				key = key[:-1] + (hashlib.md5(bytes(wkb)).digest() if wkb else None,)
+
+			if None in key:
+				null_keys += 1
+				is_duplicate = False
+			else:
+				is_duplicate = key in seen
+				if is_duplicate: duplicates.add(row[0])
+				else: seen.add(key)
+
+			#only rewrite rows whose tag changes
+			if tag_field and row[-1] != int(is_duplicate):
+				row[-1] = int(is_duplicate)
+				cursor.updateRow(row)
+
+	arcpy.AddMessage("{} duplicate(s) on {} in {}".format(len(duplicates),
+					", ".join(fields[1:1 + n_keys]), table))
+	if null_keys:
+		arcpy.AddWarning("{} row(s) with a null key skipped".format(null_keys))
+	return duplicates
+
 def remove_rows_with_attribute(table, field, value):
 
 	where = field + " = " + value